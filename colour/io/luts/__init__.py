@@ -15,11 +15,10 @@ from __future__ import annotations
 
 import os
 
-from colour.hints import Any, Boolean, Integer, Literal, Optional, Union, cast
+from colour.hints import Any, Boolean, Integer, Literal, Optional, Union
 from colour.utilities import (
     CaseInsensitiveMapping,
     filter_kwargs,
-    optional,
     validate_method,
 )
 
@@ -103,6 +102,43 @@ References
 """
 
 
+def _is_resolve_cube(path: str) -> Boolean:
+    """
+    Return whether given *.cube* *LUT* file header uses keywords specific to
+    the *Resolve* *.cube* format, i.e. an input range or both a 1D and a 3D
+    *LUT* size.
+
+    Parameters
+    ----------
+    path
+        *LUT* path.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the *.cube* *LUT* file is a *Resolve* *.cube* *LUT* file.
+    """
+
+    keywords = set()
+    with open(path) as cube_file:
+        for line in cube_file:
+            tokens = line.split()
+
+            if len(tokens) == 0 or tokens[0].startswith("#"):
+                continue
+
+            # The header ends with the first table row.
+            if not tokens[0][0].isalpha():
+                break
+
+            keywords.add(tokens[0])
+
+    return (
+        bool(keywords & {"LUT_1D_INPUT_RANGE", "LUT_3D_INPUT_RANGE"})
+        or {"LUT_1D_SIZE", "LUT_3D_SIZE"} <= keywords
+    )
+
+
 def read_LUT(
     path: str,
     method: Optional[
@@ -206,27 +242,19 @@ or :class:`colour.LUTSequence` or :class:`colour.LUTOperatorMatrix`
     Offset     : [ 0.  0.  0.  0.]
     """
 
-    method = cast(
-        str,
-        optional(
-            method, MAPPING_EXTENSION_TO_LUT_FORMAT[os.path.splitext(path)[-1]]
-        ),
-    )
+    if method is None:
+        method = MAPPING_EXTENSION_TO_LUT_FORMAT[os.path.splitext(path)[-1]]
 
     method = validate_method(method, LUT_READ_METHODS)
 
+    # Case where a "Resolve Cube", e.g. with "LUT3x1D" shaper, would be read
+    # as an "Iridas Cube" "LUT".
+    if method == "iridas cube" and _is_resolve_cube(path):
+        method = "resolve cube"
+
     function = LUT_READ_METHODS[method]
 
-    try:
-        return function(path, **filter_kwargs(function, **kwargs))
-    except ValueError as error:
-        # Case where a "Resolve Cube" with "LUT3x1D" shaper was read as an
-        # "Iridas Cube" "LUT".
-        if method == "iridas cube":
-            function = LUT_READ_METHODS["Resolve Cube"]
-            return function(path, **filter_kwargs(function, **kwargs))
-        else:
-            raise error
+    return function(path, **filter_kwargs(function, **kwargs))
 
 
 LUT_WRITE_METHODS = CaseInsensitiveMapping(
@@ -329,12 +357,8 @@ def write_LUT(
     >>> write_LUT(LUT, 'My_LUT.cube')  # doctest: +SKIP
     """
 
-    method = cast(
-        str,
-        optional(
-            method, MAPPING_EXTENSION_TO_LUT_FORMAT[os.path.splitext(path)[-1]]
-        ),
-    )
+    if method is None:
+        method = MAPPING_EXTENSION_TO_LUT_FORMAT[os.path.splitext(path)[-1]]
 
     method = validate_method(method, LUT_WRITE_METHODS)
 
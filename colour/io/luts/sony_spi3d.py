@@ -11,13 +11,17 @@ objects:
 
 from __future__ import annotations
 
+import io
 import numpy as np
+import os
+import re
 
+from colour.constants import DEFAULT_FLOAT_DTYPE
 from colour.io.luts import LUT3D, LUTSequence
 from colour.io.luts.common import path_to_title
-from colour.hints import Boolean, Integer, List, Tuple, Union
+from colour.hints import Boolean, Dict, Integer, List, NDArray, Union
 from colour.utilities import (
-    as_float_array,
+    CACHE_REGISTRY,
     as_int_array,
     as_int_scalar,
     attest,
@@ -36,6 +40,83 @@ __all__ = [
     "write_LUT_SonySPI3D",
 ]
 
+_REGEX_COMMENT = re.compile(b"^[ \t]*#(.*)$", re.MULTILINE)
+
+_REGEX_SIZE = re.compile(
+    rb"^[ \t]*(\d+)[ \t]+\1[ \t]+\1[ \t\r]*$", re.MULTILINE
+)
+
+_DOMAIN_SONY_SPI3D: NDArray = np.array(
+    [[0, 0, 0], [1, 1, 1]], dtype=DEFAULT_FLOAT_DTYPE
+)
+_DOMAIN_SONY_SPI3D.setflags(write=False)
+
+_SIZE_WRITE_CHUNK: Integer = 4096
+
+_SIZE_WRITE_BUFFER: Integer = 2**20
+
+_SIZE_CACHE_LUTS: Integer = 8
+
+_SIZE_CACHE_FORMAT_TEMPLATES: Integer = 4
+
+_CACHE_LUTS: Dict = CACHE_REGISTRY.register_cache(f"{__name__}._CACHE_LUTS")
+
+_CACHE_FORMAT_TEMPLATES: Dict = CACHE_REGISTRY.register_cache(
+    f"{__name__}._CACHE_FORMAT_TEMPLATES"
+)
+
+
+def _format_templates(size: Integer, decimals: Integer) -> List[str]:
+    """
+    Return the *Sony* *.spi3d* *LUT* data block format templates for given
+    size and decimals.
+
+    The indexes are written literally in the templates, leaving only the
+    table values to be formatted, with one template per chunk of rows. The
+    templates are cached for the 4 most recently used size and decimals
+    pairs, the templates for a size of 64 take about 7MB.
+
+    Parameters
+    ----------
+    size
+        *LUT* size.
+    decimals
+        Formatting decimals.
+
+    Returns
+    -------
+    :class:`list`
+        *LUT* data block format templates.
+    """
+
+    global _CACHE_FORMAT_TEMPLATES
+
+    key = (size, decimals)
+    if key in _CACHE_FORMAT_TEMPLATES:
+        templates = _CACHE_FORMAT_TEMPLATES.pop(key)
+        _CACHE_FORMAT_TEMPLATES[key] = templates
+
+        return templates
+
+    values_format = " ".join([f"%0.{decimals}f"] * 3)
+    rows = [
+        f"{i} {j} {k} {values_format}\n"
+        for i, j, k in zip(
+            *np.indices([size, size, size]).reshape([3, -1]).tolist()
+        )
+    ]
+    templates = [
+        "".join(rows[i : i + _SIZE_WRITE_CHUNK])
+        for i in range(0, len(rows), _SIZE_WRITE_CHUNK)
+    ]
+
+    if len(_CACHE_FORMAT_TEMPLATES) >= _SIZE_CACHE_FORMAT_TEMPLATES:
+        del _CACHE_FORMAT_TEMPLATES[next(iter(_CACHE_FORMAT_TEMPLATES))]
+
+    _CACHE_FORMAT_TEMPLATES[key] = templates
+
+    return templates
+
 
 def read_LUT_SonySPI3D(path: str) -> LUT3D:
     """
@@ -51,6 +132,16 @@ def read_LUT_SonySPI3D(path: str) -> LUT3D:
     :class:`colour.LUT3D`
         :class:`LUT3D` class instance.
 
+    Notes
+    -----
+    -   If the *COLOUR_SCIENCE__CACHE_LUTS* environment variable is set to
+        any non-empty value, *0* and *False* included, the parsed *LUT* is
+        cached per path, and a copy of the cached *LUT* is returned as long as
+        the file modification time and size are unchanged. The cache is kept
+        in-process, holds the 8 most recently read *LUTs* and the entry for a
+        path is evicted when :func:`colour.io.write_LUT_SonySPI3D` writes to
+        it.
+
     Examples
     --------
     Reading an ordered and an unordered 3D *Sony* *.spi3d* *LUT*:
@@ -82,52 +173,67 @@ def read_LUT_SonySPI3D(path: str) -> LUT3D:
     Comment 01 : Adapted from a LUT generated by Foundry::LUT.
     """
 
+    global _CACHE_LUTS
+
+    caching = bool(os.environ.get("COLOUR_SCIENCE__CACHE_LUTS"))
+    if caching:
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        if key in _CACHE_LUTS:
+            cached_signature, cached_LUT = _CACHE_LUTS.pop(key)
+            if cached_signature == signature:
+                _CACHE_LUTS[key] = (cached_signature, cached_LUT)
+
+                return cached_LUT.copy()
+
     title = path_to_title(path)
-    domain_min, domain_max = np.array([0, 0, 0]), np.array([1, 1, 1])
-    size: Integer = 2
-    data_table = []
-    data_indexes = []
-    comments = []
-
-    with open(path) as spi3d_file:
-        lines = filter(None, (line.strip() for line in spi3d_file.readlines()))
-        for line in lines:
-            if line.startswith("#"):
-                comments.append(line[1:].strip())
-                continue
-
-            tokens = line.split()
-            if len(tokens) == 3:
-                attest(
-                    len(set(tokens)) == 1,
-                    'Non-uniform "LUT" shape is unsupported!',
-                )
-
-                size = as_int_scalar(tokens[0])
-            if len(tokens) == 6:
-                data_table.append(as_float_array(tokens[3:]))
-                data_indexes.append(as_int_array(tokens[:3]))
-
-    indexes = as_int_array(data_indexes)
-    sorting_indexes = np.lexsort((indexes[:, 2], indexes[:, 1], indexes[:, 0]))
+
+    with open(path, "rb") as spi3d_file:
+        content = spi3d_file.read()
+
+    match = _REGEX_SIZE.search(content)
+    if match is None:
+        raise ValueError(
+            'Undefined "LUT" size or non-uniform "LUT" shape is unsupported!'
+        )
+
+    size = as_int_scalar(match.group(1))
+
+    comments = [
+        comment.strip().decode("utf-8")
+        for comment in _REGEX_COMMENT.findall(content)
+    ]
+
+    spi3d_data = io.BytesIO(content)
+    spi3d_data.seek(match.end())
+    data = np.loadtxt(
+        spi3d_data, comments="#", dtype=DEFAULT_FLOAT_DTYPE, ndmin=2
+    )
+
+    indexes = as_int_array(data[:, :3])
+    flat_indexes = indexes @ as_int_array([size**2, size, 1])
 
     attest(
-        np.array_equal(
-            indexes[sorting_indexes],
-            as_int_array(
-                np.around(LUT3D.linear_table(size) * (size - 1))
-            ).reshape((-1, 3)),
-        ),
+        bool(np.all((indexes >= 0) & (indexes < size)))
+        and bool(np.all(np.bincount(flat_indexes, minlength=size**3) == 1)),
         'Indexes do not match expected "LUT3D" indexes!',
     )
 
-    table = as_float_array(data_table)[sorting_indexes].reshape(
-        [size, size, size, 3]
-    )
+    table = np.empty([size**3, 3], dtype=DEFAULT_FLOAT_DTYPE)
+    table[flat_indexes] = data[:, 3:]
+    table = table.reshape([size, size, size, 3])
 
-    return LUT3D(
-        table, title, np.vstack([domain_min, domain_max]), comments=comments
-    )
+    LUT = LUT3D(table, title, np.copy(_DOMAIN_SONY_SPI3D), comments=comments)
+
+    if caching:
+        if len(_CACHE_LUTS) >= _SIZE_CACHE_LUTS:
+            del _CACHE_LUTS[next(iter(_CACHE_LUTS))]
+
+        _CACHE_LUTS[key] = (signature, LUT.copy())
+
+    return LUT
 
 
 def write_LUT_SonySPI3D(
@@ -182,42 +288,26 @@ def write_LUT_SonySPI3D(
     attest(isinstance(LUTxD, LUT3D), '"LUT" must be either a 3D "LUT"!')
 
     attest(
-        np.array_equal(
-            LUTxD.domain,
-            np.array(
-                [
-                    [0, 0, 0],
-                    [1, 1, 1],
-                ]
-            ),
-        ),
+        np.array_equal(LUTxD.domain, _DOMAIN_SONY_SPI3D),
         '"LUT" domain must be [[0, 0, 0], [1, 1, 1]]!',
     )
 
-    def _format_array(array: Union[List, Tuple]) -> str:
-        """Format given array as a *Sony* *.spi3d* data row."""
-
-        return "{1:d} {2:d} {3:d} {4:0.{0}f} {5:0.{0}f} {6:0.{0}f}".format(
-            decimals, *array
-        )
-
-    with open(path, "w") as spi3d_file:
+    with open(path, "w", buffering=_SIZE_WRITE_BUFFER) as spi3d_file:
         spi3d_file.write("SPILUT 1.0\n")
 
         spi3d_file.write("3 3\n")
 
         spi3d_file.write("{0} {0} {0}\n".format(LUTxD.size))
 
-        indexes = as_int_array(
-            np.around(LUTxD.linear_table(LUTxD.size) * (LUTxD.size - 1))
-        ).reshape([-1, 3])
         table = LUTxD.table.reshape([-1, 3])
-
-        for i, row in enumerate(indexes):
-            spi3d_file.write(f"{_format_array(list(row) + list(table[i]))}\n")
+        for i, template in enumerate(_format_templates(LUTxD.size, decimals)):
+            chunk = table[i * _SIZE_WRITE_CHUNK : (i + 1) * _SIZE_WRITE_CHUNK]
+            spi3d_file.write(template % tuple(chunk.ravel().tolist()))
 
         if LUTxD.comments:
             for comment in LUTxD.comments:
                 spi3d_file.write(f"# {comment}\n")
 
+    _CACHE_LUTS.pop(os.path.abspath(path), None)
+
     return True
@@ -100,6 +100,13 @@ class TestReadLUT(unittest.TestCase):
         )
         self.assertEqual(LUT_2[1].size, 4)
 
+        LUT_3 = read_LUT(
+            os.path.join(LUTS_DIRECTORY, "resolve_cube", "Demo.cube")
+        )
+        np.testing.assert_array_equal(
+            LUT_3.domain, np.array([[0, 0, 0], [3, 3, 3]])
+        )
+
     def test_raise_exception_read_LUT(self):
         """
         Test :func:`colour.io.luts.__init__.read_LUT` definition raised
@@ -181,6 +188,19 @@ class TestWriteLUT(unittest.TestCase):
 
         self.assertEqual(LUT_2_r, LUT_2_t)
 
+        write_LUT(
+            LUT_1_r,
+            os.path.join(self._temporary_directory, "eotf_sRGB_1D.lut"),
+            method="Sony SPI1D",
+        )
+
+        LUT_3_t = read_LUT(
+            os.path.join(self._temporary_directory, "eotf_sRGB_1D.lut"),
+            method="Sony SPI1D",
+        )
+
+        self.assertEqual(LUT_1_r, LUT_3_t)
+
 
 if __name__ == "__main__":
     unittest.main()
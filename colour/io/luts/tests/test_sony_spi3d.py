@@ -8,6 +8,7 @@ import os
 import shutil
 import tempfile
 import unittest
+from unittest import mock
 
 from colour.io import (
     LUT3D,
@@ -15,6 +16,7 @@ from colour.io import (
     read_LUT_SonySPI3D,
     write_LUT_SonySPI3D,
 )
+from colour.io.luts.sony_spi3d import _CACHE_LUTS, _SIZE_CACHE_LUTS
 from colour.utilities import as_int_array
 
 __author__ = "Colour Developers"
@@ -41,6 +43,16 @@ class TestReadLUTSonySPI3D(unittest.TestCase):
     unit tests methods.
     """
 
+    def setUp(self):
+        """Initialise the common tests attributes."""
+
+        self._temporary_directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """After tests actions."""
+
+        shutil.rmtree(self._temporary_directory)
+
     def test_read_LUT_SonySPI3D(self):
         """Test :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition."""
 
@@ -181,6 +193,105 @@ class TestReadLUTSonySPI3D(unittest.TestCase):
             LUT_2.comments, ["Adapted from a LUT generated by Foundry::LUT."]
         )
 
+    def test_read_LUT_SonySPI3D_caching(self):
+        """
+        Test :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition
+        caching.
+        """
+
+        path = os.path.join(self._temporary_directory, "Colour_Correct.spi3d")
+        shutil.copyfile(
+            os.path.join(LUTS_DIRECTORY, "Colour_Correct.spi3d"), path
+        )
+
+        _CACHE_LUTS.clear()
+        os.environ["COLOUR_SCIENCE__CACHE_LUTS"] = "True"
+        try:
+            with mock.patch.object(
+                np, "loadtxt", wraps=np.loadtxt
+            ) as mock_loadtxt:
+                LUT_1 = read_LUT_SonySPI3D(path)
+                self.assertIn(os.path.abspath(path), _CACHE_LUTS)
+                self.assertEqual(mock_loadtxt.call_count, 1)
+
+                LUT_2 = read_LUT_SonySPI3D(path)
+                self.assertEqual(mock_loadtxt.call_count, 1)
+                self.assertEqual(LUT_1, LUT_2)
+                self.assertIsNot(LUT_1.table, LUT_2.table)
+
+                # A modification time change invalidates the entry.
+                stat = os.stat(path)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+                read_LUT_SonySPI3D(path)
+                self.assertEqual(mock_loadtxt.call_count, 2)
+
+                # A same size rewrite, keeping the modification time as a
+                # coarse modification time file system would, evicts the
+                # entry.
+                write_LUT_SonySPI3D(LUT3D(size=4), path)
+                stat = os.stat(path)
+                read_LUT_SonySPI3D(path)
+
+                LUT_3 = LUT3D(LUT3D.linear_table(4) ** (1 / 2.2))
+                write_LUT_SonySPI3D(LUT_3, path)
+                self.assertEqual(os.stat(path).st_size, stat.st_size)
+                os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                np.testing.assert_almost_equal(
+                    read_LUT_SonySPI3D(path).table, LUT_3.table, decimal=7
+                )
+                self.assertEqual(mock_loadtxt.call_count, 4)
+
+            # The cache is bounded.
+            for i in range(_SIZE_CACHE_LUTS + 1):
+                path_i = os.path.join(self._temporary_directory, f"{i}.spi3d")
+                write_LUT_SonySPI3D(LUT3D(size=2), path_i)
+                read_LUT_SonySPI3D(path_i)
+
+            self.assertEqual(len(_CACHE_LUTS), _SIZE_CACHE_LUTS)
+            self.assertNotIn(os.path.abspath(path), _CACHE_LUTS)
+        finally:
+            del os.environ["COLOUR_SCIENCE__CACHE_LUTS"]
+            _CACHE_LUTS.clear()
+
+    def test_raise_exception_read_LUT_SonySPI3D(self):
+        """
+        Test :func:`colour.io.luts.sony_spi3d.read_LUT_SonySPI3D` definition
+        raised exception.
+        """
+
+        with open(
+            os.path.join(LUTS_DIRECTORY, "Colour_Correct.spi3d")
+        ) as spi3d_file:
+            lines = spi3d_file.readlines()
+
+        path = os.path.join(self._temporary_directory, "Invalid.spi3d")
+
+        # Non-uniform "LUT" shape.
+        with open(path, "w") as spi3d_file:
+            spi3d_file.writelines(lines[:2] + ["4 4 3\n"] + lines[3:])
+
+        self.assertRaises(ValueError, read_LUT_SonySPI3D, path)
+
+        # Duplicated indexes, i.e. "0 0 1" replaced with "0 0 0".
+        with open(path, "w") as spi3d_file:
+            spi3d_file.writelines(
+                lines[:4]
+                + [lines[4].replace("0 0 1 ", "0 0 0 ", 1)]
+                + lines[5:]
+            )
+
+        self.assertRaises(AssertionError, read_LUT_SonySPI3D, path)
+
+        # Out of range indexes aliasing valid flat indexes.
+        with open(path, "w") as spi3d_file:
+            spi3d_file.writelines(
+                lines[:7]
+                + [lines[7].replace("0 1 0 ", "0 0 4 ", 1)]
+                + lines[8:]
+            )
+
+        self.assertRaises(AssertionError, read_LUT_SonySPI3D, path)
+
 
 class TestWriteLUTSonySPI3D(unittest.TestCase):
     """